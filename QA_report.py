@@ -1,14 +1,22 @@
 from itertools import count
 from shlex import join
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from graphlib import CycleError, TopologicalSorter
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_numeric_dtype, is_datetime64_any_dtype
 import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from pathlib import Path
 from config import get_config
 from lib.pdf_qa_report import PDFQAReport
 from lib.md_qa_report import MarkdownQAReport
 import datetime
+import hashlib
 
 # base configuration in configs\config.base.py
 # workbooks exported from the MDMS go in a folder called "workbooks"
@@ -29,7 +37,122 @@ def make_safe(filename):
     return filename.replace(" ", "_").replace("'", "").replace(":", "").replace("/", "-")
 
 
-def load_data(filepath, group_name_source, workbook_def, testing_group, filter_date, start, end):
+def read_sheet(xls, sheet_name, sheet_dtypes, backend_kwargs):
+    """
+    Reads one sheet of an open Excel workbook with its configured dtypes.
+
+    Args:
+        xls (pd.ExcelFile): The open workbook.
+        sheet_name (str): Name of the sheet to read.
+        sheet_dtypes (dict): Column dtypes per sheet name. Datetime columns are parsed as dates.
+        backend_kwargs (dict): Extra keyword arguments for pd.read_excel (dtype_backend).
+
+    Returns:
+        pd.DataFrame: The sheet's data.
+    """
+    # split the declared dtypes into dates (parsed by the reader) and everything else
+    dtype_map = dict(sheet_dtypes.get(sheet_name, {}))
+    parse_dates = [col for col, dtype in dtype_map.items() if str(dtype).startswith("datetime")]
+    for col in parse_dates:
+        dtype_map.pop(col)
+    return pd.read_excel(xls, sheet_name=sheet_name, dtype=dtype_map or None, parse_dates=parse_dates or False, **backend_kwargs)
+
+
+# parsed sheet cache files older than this are deleted, and only the newest SHEET_CACHE_MAX_FILES are kept
+SHEET_CACHE_MAX_AGE = datetime.timedelta(days=30)
+SHEET_CACHE_MAX_FILES = 10
+
+
+def prune_sheet_cache(cache_dir):
+    """
+    Deletes parsed sheet cache files that are older than SHEET_CACHE_MAX_AGE or beyond the newest SHEET_CACHE_MAX_FILES.
+    Each new or changed workbook adds a cache file, so without this the cache folder only ever grows.
+
+    Args:
+        cache_dir (Path): Directory holding the parsed sheet cache.
+    """
+    if not cache_dir.is_dir():
+        return
+    oldest = (datetime.datetime.now() - SHEET_CACHE_MAX_AGE).timestamp()
+    cache_files = sorted(((f.stat().st_mtime, f) for f in cache_dir.glob("*.pkl")), reverse=True)
+    for i, (mtime, cache_file) in enumerate(cache_files):
+        if i >= SHEET_CACHE_MAX_FILES or mtime < oldest:
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                print(f"Warning: Could not delete the old sheet cache '{cache_file}': {e}")
+
+
+def read_workbook_sheets(filepath, sheet_names, engine=None, sheet_dtypes=None, backend_kwargs=None, cache_dir=None):
+    """
+    Reads the listed sheets from an Excel workbook, skipping any the workbook doesn't have.
+
+    When cache_dir is given the parsed sheets are pickled there and reused on later runs, skipping the Excel parse
+    until the workbook file or the read options change. Old cache files are pruned by prune_sheet_cache.
+    Loading a pickle can run arbitrary code, so only use a cache_dir that nobody untrusted can write to.
+
+    Args:
+        filepath (Path): Path to the Excel file.
+        sheet_names (list): Names of the sheets to read.
+        engine (str): Excel reader engine passed to pandas (optional).
+        sheet_dtypes (dict): Column dtypes per sheet name (optional).
+        backend_kwargs (dict): Extra keyword arguments for pd.read_excel (dtype_backend).
+        cache_dir (Path): Directory for the parsed sheet cache (optional).
+
+    Returns:
+        dict: DataFrames by sheet name, or None if the workbook could not be read.
+    """
+    sheet_dtypes = sheet_dtypes or {}
+    backend_kwargs = backend_kwargs or {}
+    sheet_names = list(dict.fromkeys(sheet_names))
+    filepath = Path(filepath)
+    try:
+        file_stat = filepath.stat()
+    except FileNotFoundError:
+        print(f"Error: File '{filepath}' not found.")
+        return None
+
+    cache_file = None
+    if cache_dir is not None:
+        # the cache is only valid for this exact file (size and modified time) read with the same options
+        cache_key = repr((
+            file_stat.st_size, file_stat.st_mtime_ns, sheet_names,
+            {name: sheet_dtypes.get(name) for name in sheet_names}, backend_kwargs, engine, pd.__version__,
+        ))
+        cache_file = cache_dir / f"{filepath.stem}_{hashlib.blake2b(cache_key.encode('utf-8'), digest_size=8).hexdigest()}.pkl"
+        if cache_file.exists():
+            print(f"Using cached sheets from {cache_file}")
+            sheets = pd.read_pickle(cache_file)
+            # touch the file so prune_sheet_cache counts its age from the last use rather than when it was written
+            try:
+                os.utime(cache_file)
+            except OSError as e:
+                print(f"Warning: Could not update the sheet cache '{cache_file}': {e}")
+            return sheets
+
+    try:
+        xls = pd.ExcelFile(filepath, engine=engine)
+    except Exception as e:
+        print(f"Error loading Excel file: {e}")
+        return None
+    sheets = {
+        sheet_name: read_sheet(xls, sheet_name, sheet_dtypes, backend_kwargs)
+        for sheet_name in sheet_names
+        if sheet_name in xls.sheet_names
+    }
+
+    if cache_file is not None:
+        try:
+            ensure_path_exists(cache_dir)
+            pd.to_pickle(sheets, cache_file)
+        except OSError as e:
+            print(f"Warning: Could not write the sheet cache '{cache_file}': {e}")
+        # the cache only grows when a file is added, so this is the one place it needs trimming
+        prune_sheet_cache(cache_dir)
+    return sheets
+
+
+def load_data(filepath, group_name_source, workbook_def, testing_group, filter_date, start, end, engine=None, sheet_dtypes=None, dtype_backend=None, cache_dir=None):
     """
     Loads data from an Excel workbook, filtering by group and date if specified.
 
@@ -41,18 +164,21 @@ def load_data(filepath, group_name_source, workbook_def, testing_group, filter_d
         filter_date (bool): Whether to filter data by date.
         start (datetime): Start date for filtering.
         end (datetime): End date for filtering.
+        engine (str): Excel reader engine passed to pandas (optional, e.g. "calamine").
+        sheet_dtypes (dict): Column dtypes per sheet name applied at read time (optional). Datetime columns are parsed as dates.
+        dtype_backend (str): pandas dtype backend for the sheets (optional, "pyarrow" or "numpy_nullable").
+        cache_dir (Path): Directory to cache the parsed sheets in for later runs (optional).
 
     Returns:
         dict: A dictionary where keys are group names and values are dictionaries of DataFrames for that group.
     """
     print(f"Loading data from {filepath}...")
-    try:
-        xls = pd.ExcelFile(filepath)
-    except FileNotFoundError:
-        print(f"Error: File '{filepath}' not found.")
-        return {}
-    except Exception as e:
-        print(f"Error loading Excel file: {e}")
+    # pandas rejects dtype_backend=None so only pass it when one is configured
+    backend_kwargs = {"dtype_backend": dtype_backend} if dtype_backend else {}
+    # every sheet is parsed once, the group name source is usually one of the report sheets too
+    sheet_names = list(workbook_def) + ([group_name_source] if testing_group is None else [])
+    sheets = read_workbook_sheets(filepath, sheet_names, engine=engine, sheet_dtypes=sheet_dtypes, backend_kwargs=backend_kwargs, cache_dir=cache_dir)
+    if sheets is None:
         return {}
     workbook_data = {}
     if testing_group is not None:
@@ -61,8 +187,8 @@ def load_data(filepath, group_name_source, workbook_def, testing_group, filter_d
         relevant_group_names = ["QA"]  # Default for area-scale books or if groups can't be found.
 
         # For multi-group workbooks, try to extract unique "GroupName" values from "FishSurveyEffort".
-        if group_name_source in xls.sheet_names:
-            trip_grouping_df = pd.read_excel(xls, sheet_name=group_name_source)
+        if group_name_source in sheets:
+            trip_grouping_df = sheets[group_name_source]
             if "GroupName" in trip_grouping_df.columns:
                 groups = trip_grouping_df["GroupName"].dropna().unique()
                 if groups.size > 0:
@@ -72,9 +198,9 @@ def load_data(filepath, group_name_source, workbook_def, testing_group, filter_d
     
     dfs = {}
     for sheet_name in workbook_def:
-        if sheet_name in xls.sheet_names:
+        if sheet_name in sheets:
             print(f"Reading sheet: {sheet_name}")
-            df = pd.read_excel(xls, sheet_name=sheet_name)
+            df = sheets[sheet_name]
             # Clean column names (strip whitespace) to prevent mismatch errors
             #df.columns = df.columns.astype(str).str.strip()
             # filter data to the specified date range if the date column exists
@@ -84,10 +210,20 @@ def load_data(filepath, group_name_source, workbook_def, testing_group, filter_d
                 else "date" if "date" in df.columns else None
             )
             if filter_date and date_col:
-                df[date_col] = pd.to_datetime(df[date_col])
-                df = df[(df[date_col] >= start) & (df[date_col] <= end)]
-                df["Year"] = df[date_col].dt.year
-                df["Month"] = df[date_col].dt.month
+                # dates are usually already parsed by the reader (or via sheet_dtypes) so only convert if needed
+                if not is_datetime64_any_dtype(df[date_col]):
+                    df[date_col] = pd.to_datetime(df[date_col])
+                if df[date_col].is_monotonic_increasing:
+                    # sorted dates (no NaT): two binary searches find the date window
+                    dates = df[date_col].to_numpy()
+                    lo = np.searchsorted(dates, np.datetime64(start), side="left")
+                    hi = np.searchsorted(dates, np.datetime64(end), side="right")
+                    df = df.iloc[lo:hi]
+                else:
+                    df = df[(df[date_col] >= start) & (df[date_col] <= end)]
+                # Year and Month from a single cast to months since 1970
+                months = df[date_col].to_numpy().astype("datetime64[M]").astype(np.int64)
+                df = df.assign(Year=months // 12 + 1970, Month=months % 12 + 1)
 
             
             dfs[sheet_name] = df
@@ -97,34 +233,63 @@ def load_data(filepath, group_name_source, workbook_def, testing_group, filter_d
             print(f"Warning: Sheet '{sheet_name}' not found in the Excel file.")
     
     #filter to the groupname if GroupName column exists. "QA" is the default group name assigned for area-scale project books where GroupName is not a column.
+    # group each sheet once rather than scanning the whole sheet for every group
+    grouped = {
+        sheet: df.groupby("GroupName", sort=False, observed=True) if "GroupName" in df.columns else None
+        for sheet, df in dfs.items()
+    }
     for group_name in relevant_group_names:
         print(f"Filtering to group: {group_name}")
-        grp_dfs = dfs.copy()
-        for sheet in grp_dfs:
-            if "GroupName" in grp_dfs[sheet].columns:
-                grp_dfs[sheet] = grp_dfs[sheet][grp_dfs[sheet]["GroupName"] == group_name]
+        grp_dfs = {}
+        for sheet, df in dfs.items():
+            if grouped[sheet] is None:
+                grp_dfs[sheet] = df
+            elif group_name in grouped[sheet].groups:
+                grp_dfs[sheet] = grouped[sheet].get_group(group_name)
+            else:
+                # group has no rows in this sheet
+                grp_dfs[sheet] = df.iloc[:0]
         workbook_data[group_name] = grp_dfs
 
     return workbook_data
 
 
-def join_tables_generic(dfs, joins_required):
+def join_tables_generic(dfs, joins_required, verbose=True):
     """
     Joins tables based on the configuration provided in `joins_required`.
 
     Args:
         dfs (dict): Dictionary of DataFrames loaded from the workbook.
         joins_required (dict): Configuration dictionary specifying left/right tables, join columns, and join type.
+            An optional "validate" entry (e.g. "m:1") is passed to pandas to check the join keys are unique as expected.
+            An optional "right_columns" list limits the right table to the join columns plus those columns.
+        verbose (bool): Whether to print which version (joined or workbook) of each table is used.
 
     Returns:
         dict: A dictionary containing the joined DataFrames, plus any original DataFrames that weren't involved in a join.
     """
     joined_dfs = {}
+    # right hand tables ready to merge (cut down to the join columns plus right_columns when those are listed),
+    # kept so a table used as the right side of several joins is only prepared once
+    right_dfs = {}
 
-    for left_df_name, join_info in joins_required.items():
+    # join in dependency order so a table that is the right side of a join is always fully joined itself first, whatever order the config lists them in
+    try:
+        join_order = list(TopologicalSorter(
+            {left_df_name: [join_info["right"]] if join_info["right"] in joins_required else [] for left_df_name, join_info in joins_required.items()}
+        ).static_order())
+    except CycleError as e:
+        # e.g. a table joined to itself. There is no dependency order to follow so join in the order the config lists them
+        print(f"Warning: joins_required has a circular dependency {e.args[1]}. Joining tables in config order.")
+        join_order = list(joins_required)
+
+    for left_df_name in join_order:
+        join_info = joins_required[left_df_name]
         right_df_name = join_info["right"]
-        on_cols = join_info["on"]
+        # "on" may be a single column name or a list of them
+        on_cols = [join_info["on"]] if isinstance(join_info["on"], str) else list(join_info["on"])
         how = join_info["how"]
+        right_cols = join_info.get("right_columns")
 
         if left_df_name not in dfs or right_df_name not in dfs:
             print(
@@ -140,84 +305,124 @@ def join_tables_generic(dfs, joins_required):
         else:
             left_df = dfs[left_df_name]
 
-        if (
-            right_df_name in joined_dfs
-        ):  # already joints, so we want to use the joined version of the right table for any subsequent joins to ensure we are retaining all the additional columns from previous joins. 
-            # This is important for cases where there are multiple joins that build on each other (e.g. VegCommunitySurvey is joined with VegSamplingUnits, and then VegSpeciesAbundance is joined with the result of that join). If we don't use the joined version of the right table for subsequent joins, we will lose the additional columns from the previous joins and end up with incorrect results.
-            right_df = joined_dfs[right_df_name]
-        else:
-            right_df = dfs[right_df_name]
-
-        joined_df = pd.merge(left_df, right_df, on=on_cols, how=how)
+        right_key = (right_df_name, tuple(on_cols), None if right_cols is None else tuple(right_cols))
+        if right_key not in right_dfs:
+            if (
+                right_df_name in joined_dfs
+            ):  # already joints, so we want to use the joined version of the right table for any subsequent joins to ensure we are retaining all the additional columns from previous joins. 
+                # This is important for cases where there are multiple joins that build on each other (e.g. VegCommunitySurvey is joined with VegSamplingUnits, and then VegSpeciesAbundance is joined with the result of that join). If we don't use the joined version of the right table for subsequent joins, we will lose the additional columns from the previous joins and end up with incorrect results.
+                right_df = joined_dfs[right_df_name]
+            else:
+                right_df = dfs[right_df_name]
+            if right_cols is not None:
+                # only carry the listed columns through the join so unused ones (e.g. comments) aren't copied into the left table
+                missing_cols = [col for col in right_cols if col not in right_df.columns]
+                if missing_cols:
+                    print(
+                        f"Warning: Columns {missing_cols} not found in table '{right_df_name}' for the join to '{left_df_name}'. Skipping these columns."
+                    )
+                right_df = right_df[list(dict.fromkeys(on_cols + [col for col in right_cols if col in right_df.columns]))]
+            right_dfs[right_key] = right_df
+
+        joined_df = pd.merge(left_df, right_dfs[right_key], on=on_cols, how=how, validate=join_info.get("validate"))
         joined_dfs[left_df_name] = joined_df
-        print(
+        if verbose:
+            print(
                 f"Using the join enhanced version of table '{left_df_name}' for summaries and plots."
             )
 
     # if table name in joined_dfs, use the joined version of the table, otherwise use the original version of the table. If neither exists, print an error and skip this summary.
-    for table_name in dfs.keys():
-        if table_name not in joined_dfs:
-            joined_dfs[table_name] = dfs[table_name]
+    # (kept in workbook order rather than a set difference so the tables and messages stay in a stable order)
+    unjoined_dfs = {table_name: df for table_name, df in dfs.items() if table_name not in joined_dfs}
+    joined_dfs.update(unjoined_dfs)
+    if verbose:
+        for table_name in unjoined_dfs:
             print(
                 f"Using the workbook version of table '{table_name}' for summaries and plots."
             )
-           
+
     return joined_dfs
 
 
-def filter_df(filter, df, task_type=None, task_name=None):
+# operators supported in filter definitions e.g. {"SampleType": {"==": "DriftNet"}} or {"SampleType": {"in": ["DriftNet", "LightTrap"]}}
+FILTER_OPS = {
+    "<": operator.lt,
+    ">": operator.gt,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "in": lambda col, val: col.isin(val),
+    "not in": lambda col, val: ~col.isin(val),
+}
+# FILTER_OPS that take a list of values rather than a single value
+MEMBERSHIP_FILTER_OPS = {"in", "not in"}
+
+
+def build_filter_mask(filter, df, task_type=None, task_name=None):
     """
-    Filters a DataFrame based on a dictionary of conditions.
+    Builds a single boolean row mask from a dictionary of filter conditions.
 
     Args:
         filter (dict): Dictionary where keys are column names and values are conditions (e.g., "is not null", {">": 5}).
-        df (pd.DataFrame): The DataFrame to filter.
+        df (pd.DataFrame): The DataFrame the conditions are evaluated on.
         task_type (str): Description of the task (e.g., "plot", "summary") for logging.
         task_name (str): Name of the specific task for logging.
 
     Returns:
-        pd.DataFrame: The filtered DataFrame.
+        np.ndarray: Boolean mask of the rows matching all conditions, or None if no condition could be applied.
     """
+    masks = []
     for filter_col, filter_condition in filter.items():
-        if filter_col in df.columns:
-            if (
-                isinstance(filter_condition, str)
-                and filter_condition.lower() == "is not null"
-            ):
-                df = df[df[filter_col].notna()]
-            elif (
-                isinstance(filter_condition, str)
-                and filter_condition.lower() == "is null"
-            ):
-                df = df[df[filter_col].isna()]
-            # e.g. col_name: {"<": value} or {">": value} or {"==": value} or {"!=": value}
-            elif isinstance(filter_condition, dict):
-                for op, val in filter_condition.items():
-                    if op == "<":
-                        df = df[df[filter_col] < val]
-                    elif op == ">":
-                        df = df[df[filter_col] > val]
-                    elif op == "==":
-                        df = df[df[filter_col] == val]
-                    elif op == "!=":
-                        df = df[df[filter_col] != val]
-                    elif op == "in" and isinstance(val, (list, tuple, set)):
-                        df = df[df[filter_col].isin(val)]
-                    elif op == "not in" and isinstance(val, (list, tuple, set)):
-                        df = df[~df[filter_col].isin(val)]
-                    else:
-                        print(
-                            f"Warning: Unsupported operator '{op}' in filter condition for column '{filter_col}' in {task_type} definition '{task_name}'. Skipping this filter."
-                        )
-            else:
-                print(
-                    f"Warning: Unsupported filter condition '{filter_condition}' for column '{filter_col}' in {task_type} definition '{task_name}'. Skipping this filter."
-                )
-        else:
+        if filter_col not in df.columns:
             print(
                 f"Warning: Filter column '{filter_col}' not found in table. Skipping this filter."
             )
-    return df
+            continue
+
+        col = df[filter_col]
+        if isinstance(filter_condition, str) and filter_condition.lower() == "is not null":
+            masks.append(col.notna().to_numpy())
+        elif isinstance(filter_condition, str) and filter_condition.lower() == "is null":
+            masks.append(col.isna().to_numpy())
+        # e.g. col_name: {"<": value} or {">": value} or {"==": value} or {"!=": value}
+        elif isinstance(filter_condition, dict):
+            for op, val in filter_condition.items():
+                op_func = FILTER_OPS.get(op)
+                if op_func is None or (op in MEMBERSHIP_FILTER_OPS and not isinstance(val, (list, tuple, set))):
+                    print(
+                        f"Warning: Unsupported operator '{op}' in filter condition for column '{filter_col}' in {task_type} definition '{task_name}'. Skipping this filter."
+                    )
+                    continue
+                # missing values never match a comparison
+                masks.append(op_func(col, val).to_numpy(dtype=bool, na_value=False))
+        else:
+            print(
+                f"Warning: Unsupported filter condition '{filter_condition}' for column '{filter_col}' in {task_type} definition '{task_name}'. Skipping this filter."
+            )
+
+    if not masks:
+        return None
+    return np.logical_and.reduce(masks)
+
+
+def filter_df(filter, df, task_type=None, task_name=None):
+    """
+    Filters a DataFrame based on a dictionary of conditions.
+
+    All conditions are combined into a single boolean mask so the DataFrame is only sliced once.
+
+    Args:
+        filter (dict): Dictionary where keys are column names and values are conditions (e.g., "is not null", {">": 5}).
+        df (pd.DataFrame): The DataFrame to filter.
+        task_type (str): Description of the task (e.g., "plot", "summary") for logging.
+        task_name (str): Name of the specific task for logging.
+
+    Returns:
+        pd.DataFrame: The filtered DataFrame.
+    """
+    mask = build_filter_mask(filter, df, task_type=task_type, task_name=task_name)
+    if mask is None:
+        return df
+    return df.loc[mask]
 
 
 def create_single_pie_plot(ax, df, label_col, value_col, title_str, color_map=None):
@@ -235,29 +440,28 @@ def create_single_pie_plot(ax, df, label_col, value_col, title_str, color_map=No
     # Aggregate values by label_col to combine multiple entries (e.g. strata) for the same category
     # if value_col is not a number or is the same as the category then aggregate by count
     if not is_numeric_dtype(df[value_col]) or label_col == value_col:
-        group_df_agg = df.groupby(label_col, dropna=False).size().reset_index(name="count")
-        value_col = "count"
+        group_df_agg = df.groupby(label_col, dropna=False, observed=True).size()
     else:
-        group_df_agg = df.groupby(label_col, as_index=False, dropna=False)[value_col].sum()
+        group_df_agg = df.groupby(label_col, dropna=False, observed=True)[value_col].sum()
 
-    # Filter for top 5 species for clarity
-    group_df = group_df_agg.sort_values(by=value_col, ascending=False).head(5)
+    # Filter for top 5 species for clarity.
+    # sort_values rather than nlargest or a partition, which order tied slices differently
+    plot_data = group_df_agg.sort_values(ascending=False).head(5)
+    plot_data = plot_data[plot_data > 0]
 
-    plot_data = group_df[group_df[value_col] > 0].copy()
+    labels_raw = plot_data.index.to_numpy(dtype=object, na_value="missing/not provided").astype(str)
 
     # Determine colors before mutating labels for display
     pie_colors = None
     if color_map:
-        labels_raw = plot_data[label_col].fillna("missing/not provided").astype(str)
         pie_colors = [color_map.get(lbl, "#808080") for lbl in labels_raw]
 
-    # word break category labels by replacing the " " character with \n
-    plot_data[label_col] = plot_data[label_col].fillna("missing/not provided").astype(str).str.replace(" ", "\n")
-
     if not plot_data.empty:
+        # word break category labels by replacing the " " character with \n
+        labels = [lbl.replace(" ", "\n") for lbl in labels_raw]
         ax.pie(
-            plot_data[value_col],
-            labels=plot_data[label_col],
+            plot_data.to_numpy(),
+            labels=labels,
             autopct="%1.1f%%",
             colors=pie_colors,
         )
@@ -292,26 +496,28 @@ def create_single_scatter_plot(
     """
     if color_col and color_col in df.columns:
         # Simple categorical coloring
+        # integer code per point (-1 for missing) and the categories in order of appearance
+        codes, categories = pd.factorize(df[color_col])
 
-        categories = df[color_col].dropna().unique()
-
-        if not color_map:
+        if color_map:
+            category_colors = [color_map.get(str(cat), "#808080") for cat in categories]
+        else:
             # Get default color cycle if no map provided
             prop_cycle = plt.rcParams["axes.prop_cycle"]
             colors = prop_cycle.by_key()["color"]
+            category_colors = [colors[i % len(colors)] for i in range(len(categories))]
 
-        for i, cat in enumerate(categories):
-            subset = df[df[color_col] == cat]
-            if color_map:
-                color = color_map.get(str(cat), "#808080")
-            else:
-                color = colors[i % len(colors)]
-            ax.scatter(subset[x_col], subset[y_col], label=str(cat), color=color, alpha=0.8)
+        # one scatter per category so the draw order and legend markers stay per category.
+        # points are picked by their integer category code rather than comparing the values again; points with no category are not drawn.
+        x_values, y_values = df[x_col], df[y_col]
+        for i, (cat, color) in enumerate(zip(categories, category_colors)):
+            rows = np.flatnonzero(codes == i)
+            ax.scatter(x_values.iloc[rows], y_values.iloc[rows], label=str(cat), color=color, alpha=0.8)
 
         # Add legend
         if show_legend:
             #wrap long legend items on " " and "_" by replacing with  \n
-            legend_items = [l.replace(" ", "\n").replace("_", "\n") for l in categories] if wrap_legend else categories
+            legend_items = [l.replace(" ", "\n").replace("_", "\n") for l in categories] if wrap_legend else [str(cat) for cat in categories]
             ax.legend(legend_items, title=color_col, bbox_to_anchor=(1.05, 1), loc='upper left')
 
             #ax.legend(title=color_col, bbox_to_anchor=(1.05, 1), loc='upper left')
@@ -334,13 +540,21 @@ def create_single_scatter_plot(
     ax.grid(True, linestyle='--', alpha=0.7)
 
 
-def delete_existing_plots(output_path):
+def delete_existing_plots(output_path, plot_collection=None):
     """
     Deletes existing .png plot files in the output directory to prevent confusion with new plots from the current run.
+
+    Args:
+        output_path (Path): Directory holding the plots.
+        plot_collection (dict): Optional plot collection from create_plots. When given only those files are deleted, leaving plots other groups are still using.
     """
     if output_path.exists() and output_path.is_dir():
+        if plot_collection is not None:
+            plot_files = [output_path / f for filenames in plot_collection.values() for f in (filenames or [])]
+        else:
+            plot_files = list(output_path.iterdir())
         # delete all plots in the output folder before creating new ones to avoid confusion and ensure we are only looking at the plots from the current run. We will only delete files that match the .png extension to avoid accidentally deleting other files in the output folder.
-        for filename in output_path.iterdir():
+        for filename in plot_files:
             if filename.suffix == ".png":
                 try:
                     filename.unlink() 
@@ -352,14 +566,183 @@ def delete_existing_plots(output_path):
 def get_global_color_map(df, column_name):
     if not column_name or column_name not in df.columns:
         return None
-    unique_vals = sorted(df[column_name].dropna().unique().astype(str))
-    # Use tab20 for better distinction than default tab10
+    values = df[column_name].dropna()
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # unique the integer codes rather than the values, keeping only the categories that occur
+        unique_vals = values.cat.categories[np.unique(values.cat.codes.to_numpy())]
+    else:
+        unique_vals = values.unique()
+    unique_vals = sorted(unique_vals.astype(str))
+    # Use tab20 for better distinction than default tab10, looked up for every category in one call
     cmap = plt.get_cmap("tab20")
-    colors = [cmap(i % 20) for i in range(len(unique_vals))]
-    return dict(zip(unique_vals, colors))
+    colors = cmap(np.arange(len(unique_vals)) % 20)
+    return dict(zip(unique_vals, map(tuple, colors)))
+
+
+# fast zlib level for the plot PNGs. Files are a bit larger than the default level 6 but encode much faster, the pixels are identical
+PNG_SAVE_KWARGS = {"compress_level": 1}
+
+# one figure per figure size in each process, cleared and reused for every plot of a create_plots call rather than created and torn down per plot
+_figure_cache = {}
 
 
-def create_plots(joined_dfs, data_summaries, PLOTS_DEFINITION, output_path) -> list[str]:
+def _get_figure(fig_size):
+    """
+    Returns a cleared figure and axes of the given size, reusing the one cached for this process if there is one.
+
+    Args:
+        fig_size (tuple): Figure size in inches.
+
+    Returns:
+        tuple: (matplotlib.figure.Figure, matplotlib.axes.Axes)
+    """
+    if fig_size not in _figure_cache:
+        _figure_cache[fig_size] = plt.subplots(figsize=fig_size)
+        return _figure_cache[fig_size]
+    fig, _ = _figure_cache[fig_size]
+    # clear the whole figure and add new axes, ax.cla() would keep the previous plot's aspect and spine state (e.g. from a pie)
+    fig.clf()
+    # undo the previous plot's tight_layout so the next one is laid out from the defaults like a new figure
+    fig.subplots_adjust(**{param: matplotlib.rcParams[f"figure.subplot.{param}"] for param in ("left", "right", "bottom", "top", "wspace", "hspace")})
+    ax = fig.add_subplot()
+    _figure_cache[fig_size] = (fig, ax)
+    return fig, ax
+
+
+def _close_cached_figures():
+    """
+    Closes the figures cached by _get_figure so they don't stay registered with pyplot after the plots are rendered.
+    """
+    for fig, _ in _figure_cache.values():
+        plt.close(fig)
+    _figure_cache.clear()
+
+
+def _render_one(plot_type, plot_series_name, group_key_tuple, title_str, group_df, config, output_path, num_groups, color_map=None, filename_prefix=""):
+    """
+    Renders and saves the plot for a single group. Kept at module level so it can run in a worker process.
+
+    Args:
+        plot_type (str): "pie" or "scatter".
+        plot_series_name (str): Name of the plot series, used in the output filename.
+        group_key_tuple (tuple): Group key values, used in the output filename.
+        title_str (str): Title for the plot.
+        group_df (pd.DataFrame): The data for this group, sliced to the columns the plot needs.
+        config (dict): Plot definition for the series.
+        output_path (Path): Directory to save the plot in.
+        num_groups (int): Number of groups in the series, used to size the figure.
+        color_map (dict): Optional dictionary mapping categories to colors.
+        filename_prefix (str): Prepended to the output filename.
+
+    Returns:
+        str: The filename of the saved plot, or None if there was nothing to plot.
+    """
+    fig_size=(4, 3) if num_groups > 4 else (6,4)
+    fig, ax = _get_figure(fig_size)
+
+    # Dispatch
+    if plot_type == "pie":
+        create_single_pie_plot(
+            ax,
+            group_df,
+            label_col=config.get("category"),
+            value_col=config.get("value"),
+            title_str=title_str,
+            color_map=color_map,
+        )
+    elif plot_type == "scatter":
+        x_col = config.get("x")
+        y_col = config.get("y")
+        color_col = config.get("color")
+
+        # Filter: Remove rows where both x and y are NaN
+        plot_df = group_df.dropna(subset=[x_col, y_col], how='all').copy()
+
+        if plot_df.empty:
+            return None
+
+        is_x_numeric = is_numeric_dtype(plot_df[x_col])
+        is_y_numeric = is_numeric_dtype(plot_df[y_col])
+        is_x_datetime = is_datetime64_any_dtype(plot_df[x_col])
+        is_y_datetime = is_datetime64_any_dtype(plot_df[y_col])
+   
+
+        # Aggregation logic: Aggregate if specified in config
+        agg_func = config.get("aggregate_function")
+        if agg_func:
+            if is_x_numeric and not is_y_numeric:
+                agg_cols = [y_col]
+                if color_col and color_col in plot_df.columns and color_col != y_col:
+                    agg_cols.append(color_col)
+                plot_df = plot_df.groupby(agg_cols, as_index=False, observed=True)[x_col].agg(agg_func)
+
+            elif is_y_numeric and not is_x_numeric:
+                agg_cols = [x_col]
+                if color_col and color_col in plot_df.columns and color_col != x_col:
+                    agg_cols.append(color_col)
+                plot_df = plot_df.groupby(agg_cols, as_index=False, observed=True)[y_col].agg(agg_func)
+
+        # Trim long species/site names and Sort
+        if not is_x_numeric and not is_x_datetime:
+            plot_df[x_col] = plot_df[x_col].astype(str).str[:25]
+            if is_y_numeric:
+                plot_df = plot_df.sort_values(by=y_col, ascending=True).tail(15)
+            else:
+                plot_df = plot_df.sort_values(by=x_col, ascending=True)
+
+        if not is_y_numeric and not is_y_datetime:
+            plot_df[y_col] = plot_df[y_col].astype(str).str[:25]
+            if is_x_numeric:
+                plot_df = plot_df.sort_values(by=x_col, ascending=True).tail(15)
+            elif is_x_datetime:
+                plot_df = plot_df.sort_values(by=y_col, ascending=True)
+            else:
+                plot_df = plot_df.sort_values(by=y_col, ascending=True)
+
+        create_single_scatter_plot(
+            ax,
+            plot_df,
+            x_col=x_col,
+            y_col=y_col,
+            color_col=color_col,
+            title_str=title_str,
+            show_legend=config.get("Legend", True),
+            wrap_legend = num_groups > 4,
+            color_map=color_map,
+        )
+
+    fig.tight_layout()
+
+    # Filename logic
+    safe_plot_name = make_safe(plot_series_name)
+    sanitized_key_parts = [make_safe(str(p)) for p in group_key_tuple]
+    sanitized_key = "_".join(sanitized_key_parts)
+    output_filename = f"{filename_prefix}{safe_plot_name}_{sanitized_key}.png"
+    output_plot_path = output_path / output_filename
+
+    fig.savefig(output_plot_path, bbox_inches='tight', pil_kwargs=PNG_SAVE_KWARGS)
+    return output_filename
+
+
+def missing_key_columns(summaries_config):
+    """
+    Finds the columns of each table that an unfiltered summary groups on. The summaries report missing values in these
+    columns as a "Missing" group, so plots grouped on them keep those records as a "Missing" group too.
+
+    Args:
+        summaries_config (dict): Configuration for the summaries, as passed to generate_effort_summaries.
+
+    Returns:
+        dict: Set of column names by table name.
+    """
+    key_cols = {}
+    for config in summaries_config.values():
+        if not config.get("filter"):
+            key_cols.setdefault(config["table"], set()).update(config["group_by"])
+    return key_cols
+
+
+def create_plots(joined_dfs, data_summaries, PLOTS_DEFINITION, output_path, max_workers=1, filename_prefix="", missing_key_cols=None) -> list[str]:
     """
     Generates plots based on the provided definitions and saves them to the output directory.
 
@@ -367,6 +750,10 @@ def create_plots(joined_dfs, data_summaries, PLOTS_DEFINITION, output_path) -> l
         joined_dfs (dict): Dictionary of joined pandas DataFrames.
         PLOTS_DEFINITION (dict): Configuration for the plots to be generated.
         output_path (str): Directory to save the plots in.
+        max_workers (int): Number of worker processes used to render plots. 1 (the default) renders in this process, None uses every CPU.
+        filename_prefix (str): Prepended to every plot filename so groups sharing the output directory don't overwrite each other.
+        missing_key_cols (dict): Group-by columns by table (from missing_key_columns) whose missing values are plotted as a
+            "Missing" group. Rows missing any other group-by value are not plotted.
 
     Returns:
         list[str]: A list of filenames for the generated plots.
@@ -374,9 +761,9 @@ def create_plots(joined_dfs, data_summaries, PLOTS_DEFINITION, output_path) -> l
     print("Creating plots...")
 
     plot_collection = {}
+    # (plot_series_name, render args) for every group plot, rendered together once all series are collected
+    render_tasks = []
     for plot_series_name, config in PLOTS_DEFINITION.items():
-        plot_series = []
-
         # Determine plot type
         plot_type = config.get("type")
         if not plot_type:
@@ -415,7 +802,13 @@ def create_plots(joined_dfs, data_summaries, PLOTS_DEFINITION, output_path) -> l
 
         # Grouping
         if group_by_cols:
-            groups = df.groupby(group_by_cols)
+            # rows missing a group key are only kept (as a "Missing" group, labelled below) for the keys the summaries report that way
+            keep_missing = (missing_key_cols or {}).get(table_name, set())
+            drop_missing = [col for col in group_by_cols if col not in keep_missing]
+            if drop_missing:
+                df = df.loc[df[drop_missing].notna().all(axis=1)]
+            # observed=True so categorical group columns don't produce empty plots for unused category combinations
+            groups = df.groupby(group_by_cols, dropna=False, observed=True)
         else:
             groups = [("All Data", df)]
 
@@ -424,15 +817,23 @@ def create_plots(joined_dfs, data_summaries, PLOTS_DEFINITION, output_path) -> l
             plot_collection[plot_series_name] = None
             continue
 
-        for group_key, group_df in groups:
-            fig_size=(4, 3) if len(groups) > 4 else (6,4)
-            fig, ax = plt.subplots(figsize=fig_size)
+        # only send the columns the plot uses to the worker processes
+        if plot_type == "pie":
+            plot_cols = [config.get("category"), config.get("value")]
+        else:
+            plot_cols = [config.get("x"), config.get("y")]
+            if config.get("color") in df.columns:
+                plot_cols.append(config.get("color"))
+        plot_cols = [col for col in dict.fromkeys(plot_cols) if col]
+
+        # Check if all group_by columns are numeric to decide on title format
+        all_numeric_groups = all(is_numeric_dtype(df[col]) for col in group_by_cols) if group_by_cols else False
 
+        plot_collection[plot_series_name] = []
+        for group_key, group_df in groups:
             # Title logic
             group_key_tuple = group_key if isinstance(group_key, tuple) else (group_key,)
-
-            # Check if all group_by columns are numeric to decide on title format
-            all_numeric_groups = all(is_numeric_dtype(df[col]) for col in group_by_cols) if group_by_cols else False
+            group_key_tuple = tuple("Missing" if pd.isna(val) else val for val in group_key_tuple)
 
             if all_numeric_groups and group_by_cols:
                 title_parts = [f"{col}: {val}" for col, val in zip(group_by_cols, group_key_tuple)]
@@ -444,94 +845,68 @@ def create_plots(joined_dfs, data_summaries, PLOTS_DEFINITION, output_path) -> l
                 )
                 title_str = " | ".join(map(str, group_key_tuple))
 
-            # Dispatch
-            if plot_type == "pie":
-                create_single_pie_plot(
-                    ax,
-                    group_df,
-                    label_col=config.get("category"),
-                    value_col=config.get("value"),
-                    title_str=title_str,
-                    color_map=color_map,
-                )
-            elif plot_type == "scatter":
-                x_col = config.get("x")
-                y_col = config.get("y")
-                color_col = config.get("color")
+            render_tasks.append((
+                plot_series_name,
+                (plot_type, plot_series_name, group_key_tuple, title_str, group_df[plot_cols], config, output_path, len(groups), color_map, filename_prefix),
+            ))
 
-                # Filter: Remove rows where both x and y are NaN
-                plot_df = group_df.dropna(subset=[x_col, y_col], how='all').copy()
+    if max_workers == 1:
+        # already inside a group worker (or asked for no pool), render here rather than nesting a second pool
+        try:
+            output_filenames = [_render_one(*args) for _, args in render_tasks]
+        finally:
+            # pool workers drop their cached figures when they exit; this process keeps running so close them here
+            _close_cached_figures()
+    elif render_tasks:
+        # PNG rendering is independent per group so spread it over worker processes
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [executor.submit(_render_one, *args) for _, args in render_tasks]
+            output_filenames = [future.result() for future in futures]
+    else:
+        output_filenames = []
+    for (plot_series_name, _), output_filename in zip(render_tasks, output_filenames):
+        if output_filename is None:
+            continue
+        print(f"Plot saved to {output_path / output_filename}")
+        plot_collection[plot_series_name].append(output_filename)
 
-                if plot_df.empty:
-                    plt.close(fig)
-                    continue
+    return plot_collection
 
-                is_x_numeric = is_numeric_dtype(plot_df[x_col])
-                is_y_numeric = is_numeric_dtype(plot_df[y_col])
-                is_x_datetime = is_datetime64_any_dtype(plot_df[x_col])
-                is_y_datetime = is_datetime64_any_dtype(plot_df[y_col])
-   
 
-                # Aggregation logic: Aggregate if specified in config
-                agg_func = config.get("aggregate_function")
-                if agg_func:
-                    if is_x_numeric and not is_y_numeric:
-                        agg_cols = [y_col]
-                        if color_col and color_col in plot_df.columns and color_col != y_col:
-                            agg_cols.append(color_col)
-                        plot_df = plot_df.groupby(agg_cols, as_index=False)[x_col].agg(agg_func)
-
-                    elif is_y_numeric and not is_x_numeric:
-                        agg_cols = [x_col]
-                        if color_col and color_col in plot_df.columns and color_col != x_col:
-                            agg_cols.append(color_col)
-                        plot_df = plot_df.groupby(agg_cols, as_index=False)[y_col].agg(agg_func)
-
-                # Trim long species/site names and Sort
-                if not is_x_numeric and not is_x_datetime:
-                    plot_df[x_col] = plot_df[x_col].astype(str).str[:25]
-                    if is_y_numeric:
-                        plot_df = plot_df.sort_values(by=y_col, ascending=True).tail(15)
-                    else:
-                        plot_df = plot_df.sort_values(by=x_col, ascending=True)
-
-                if not is_y_numeric and not is_y_datetime:
-                    plot_df[y_col] = plot_df[y_col].astype(str).str[:25]
-                    if is_x_numeric:
-                        plot_df = plot_df.sort_values(by=x_col, ascending=True).tail(15)
-                    elif is_x_datetime:
-                        plot_df = plot_df.sort_values(by=y_col, ascending=True)
-                    else:
-                        plot_df = plot_df.sort_values(by=y_col, ascending=True)
-
-                create_single_scatter_plot(
-                    ax,
-                    plot_df,
-                    x_col=x_col,
-                    y_col=y_col,
-                    color_col=color_col,
-                    title_str=title_str,
-                    show_legend=config.get("Legend", True),
-                    wrap_legend = len(groups) > 4,
-                    color_map=color_map,
-                )
+# surveys whose dates span longer than this are flagged by the "date range > 7d" QA check
+MAX_SURVEY_DURATION = pd.Timedelta(days=7)
 
-            plt.tight_layout()
 
-            # Filename logic
-            safe_plot_name = make_safe(plot_series_name)
-            sanitized_key_parts = [make_safe(str(p)) for p in group_key_tuple]
-            sanitized_key = "_".join(sanitized_key_parts)
-            output_filename = f"{safe_plot_name}_{sanitized_key}.png"
-            output_plot_path = output_path / output_filename
+def join_unique_values(values):
+    """
+    Formats the array of values from a "unique" summary as a sorted "; " separated string, dropping missing and empty values.
+
+    Args:
+        values: The unique values for one group (anything other than a list-like is returned unchanged).
 
-            plt.savefig(output_plot_path, bbox_inches='tight')
-            plt.close(fig)
-            print(f"Plot saved to {output_plot_path}")
-            plot_series.append(output_filename)
+    Returns:
+        str: The joined values.
+    """
+    if not hasattr(values, '__iter__') or isinstance(values, (str, bytes)):
+        return values
+    # convert each value to a string once
+    strings = (str(v) for v in values if pd.notna(v))
+    return "; ".join(sorted(v for v in strings if v != ''))
 
-        plot_collection[plot_series_name] = plot_series
-    return plot_collection
+
+@lru_cache(maxsize=None)
+def flatten_summary_column(col):
+    """
+    Flattens a (column, function) summary column name to "column\nfunction", with count shown as records.
+    Cached because the same pairs come up in many summaries.
+
+    Args:
+        col (tuple): The (column, function) pair from the agg MultiIndex.
+
+    Returns:
+        str: The flattened column name, or just the column if there is no function (e.g. the group by columns).
+    """
+    return f"{col[0]}\n{'records' if col[1] == 'count' else col[1]}" if col[1] else col[0]
 
 
 def generate_effort_summaries(joined_dfs, summaries_config):
@@ -547,6 +922,9 @@ def generate_effort_summaries(joined_dfs, summaries_config):
     """
     print("Generating effort summaries...")
     summary_tables = {}
+    # summaries over the same table and filter share one row selection, and with the same grouping one GroupBy so the key codes are only computed once
+    selections = {}
+    groupings = {}
 
     for summary_name, config in summaries_config.items():
         table_name = config["table"]
@@ -559,29 +937,53 @@ def generate_effort_summaries(joined_dfs, summaries_config):
             )
             continue
 
-        df = joined_dfs[table_name]
-        # filter the dataframe based on the filter specified in the config if it exists
-        if "filter" in config:
-            df = filter_df(
-                config["filter"], df, task_type="summary", task_name=summary_name
-            )
+        selection_key = (table_name, repr(config.get("filter")))
+        # summaries that add a sum column group a different frame so they always build their own GroupBy
+        grouping_key = None if "sum_columns" in config else selection_key + (tuple(group_by_cols),)
+        if grouping_key in groupings:
+            df, group_keys, grouped = groupings[grouping_key]
+        else:
+            if selection_key in selections:
+                df = selections[selection_key]
+            else:
+                df = joined_dfs[table_name]
+                # select the rows matching the filter specified in the config (if it exists) with a single mask
+                if "filter" in config:
+                    mask = build_filter_mask(
+                        config["filter"], df, task_type="summary", task_name=summary_name
+                    )
+                    if mask is not None:
+                        df = df.loc[mask]
+                selections[selection_key] = df
+
+            # if there are any columns in group_by_cols that are not in the dataframe, print an error and raise exception
+            missing_cols = [col for col in group_by_cols if col not in df.columns]
+            if missing_cols:
+                raise Exception(
+                    f"Error: Columns {missing_cols} not found in table '{table_name}' for summary '{summary_name}'."
+                )
 
-        # fill NaNs in grouping columns with a placeholder to avoid losing data in the groupby
-        df[group_by_cols] = df[group_by_cols].fillna("Missing")
+            # If there are sum_columns specified, create the new column before grouping (on the selection, not the shared table)
+            if "sum_columns" in config and "new_column_name" in config:
+                sum_df = df[config["sum_columns"]]
+                # plain numeric columns are summed in numpy, much faster than pandas' row-wise sum and with the same result
+                if all(isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in sum_df.dtypes):
+                    row_sums = np.nansum(sum_df.to_numpy(), axis=1)
+                else:
+                    row_sums = sum_df.sum(axis=1)
+                df = df.assign(**{config["new_column_name"]: row_sums})
 
-        # If there are sum_columns specified, create the new column before grouping
-        if "sum_columns" in config and "new_column_name" in config:
-            df[config["new_column_name"]] = df[config["sum_columns"]].sum(axis=1)
+            # fill NaNs in the grouping keys with a placeholder to avoid losing data in the groupby.
+            # The keys are grouped on directly so the joined table itself is left unchanged for later summaries and plots.
+            group_keys = [df[col].fillna("Missing") for col in group_by_cols]
 
-        # if there are any columns in group_by_cols that are not in the dataframe, print an error and raise exception
-        missing_cols = [col for col in group_by_cols if col not in df.columns]
-        if missing_cols:
-            raise Exception(
-                f"Error: Columns {missing_cols} not found in table '{table_name}' for summary '{summary_name}'."
-            )
+            # First we need to check a count of the number of groups to distinguish data sampling methods that are charactersised by large plot SampleUnitID vs (SamplePointName, TransectID) and many tiny quadrat SamplingUnitIDs
+            # the key codes are computed once by the GroupBy object and reused for the agg below
+            grouped = df.groupby(group_keys, observed=True)
+            if grouping_key is not None:
+                groupings[grouping_key] = (df, group_keys, grouped)
 
-        # First we need to check a count of the number of groups to distinguish data sampling methods that are charactersised by large plot SampleUnitID vs (SamplePointName, TransectID) and many tiny quadrat SamplingUnitIDs
-        num_groups = df.groupby(group_by_cols).ngroups
+        num_groups = grouped.ngroups
         print(f"Summary '{summary_name}' has {num_groups} groups.")
         if num_groups > 50:
             print(
@@ -599,6 +1001,17 @@ def generate_effort_summaries(joined_dfs, summaries_config):
                 group_by_cols = [
                     col for col in group_by_cols if col != "SamplingUnitID"
                 ] + ["SamplePointName", "TransectID"]
+                # the replacement keys are not filled like the configured ones, so they get their own entry
+                replaced_key = None if grouping_key is None else (grouping_key, "replaced")
+                if replaced_key in groupings:
+                    _, group_keys, grouped = groupings[replaced_key]
+                else:
+                    group_keys = [
+                        key for key in group_keys if key.name != "SamplingUnitID"
+                    ] + [df["SamplePointName"], df["TransectID"]]
+                    grouped = df.groupby(group_keys, observed=True)
+                    if replaced_key is not None:
+                        groupings[replaced_key] = (df, group_keys, grouped)
                 #Check summary functions. if sum in summary functions for any column  we need to replace with min and max
                 # this is because if we have many unique SamplingUnitIDs that are being summed together, we want to check the range of values for the new column to identify any potential data quality issues (e.g. if the sum is much higher than expected, it may indicate that there are many small quadrats with non-zero values that are being summed together, which could be a data quality issue or it could be a valid property of the data). By replacing the sum with min and max, we can check the range of values for the new column and identify any potential outliers or data quality issues.
                 for col in list(summary_funcs.keys()):
@@ -607,16 +1020,13 @@ def generate_effort_summaries(joined_dfs, summaries_config):
 
 
         # Group by specified columns and apply summary functions
-        summary_df = df.groupby(group_by_cols).agg(summary_funcs).reset_index()
+        summary_df = grouped.agg(summary_funcs).reset_index()
 
         # rename any summary_func columns to include the function name (e.g. SampleDate_nunique, SampleDate_count) to avoid confusion if there are multiple summary functions applied to the same column
         # Flatten MultiIndex columns if they exist (happens when multiple summary functions are used)
         
         if isinstance(summary_df.columns, pd.MultiIndex):
-            summary_df.columns = [
-                f"{col[0]}\n{'records' if col[1] == 'count' else col[1]}" if col[1] else col[0]
-                for col in summary_df.columns
-            ]
+            summary_df.columns = summary_df.columns.map(flatten_summary_column)
         else:
             # Handle single level columns (renaming based on the single function applied)
             # This logic assumes a simple mapping where we want to append the function name
@@ -638,9 +1048,7 @@ def generate_effort_summaries(joined_dfs, summaries_config):
         # Post-process "unique" columns to format lists as strings, removing NaNs
         for col in summary_df.columns:
             if str(col).endswith("\nunique"):
-                summary_df[col] = summary_df[col].apply(
-                    lambda x: "; ".join(sorted([str(v) for v in x if pd.notna(v) and str(v) != ''])) if hasattr(x, '__iter__') and not isinstance(x, (str, bytes)) else x
-                )
+                summary_df[col] = [join_unique_values(x) for x in summary_df[col].to_numpy()]
 
         # Initialize QA Check column
         col_map = {}
@@ -663,10 +1071,8 @@ def generate_effort_summaries(joined_dfs, summaries_config):
         # make a list of all columns that have a function of "count"
         count_cols = [col for col, func in col_map.items() if func == "count"]
         first_count_col = count_cols[0] if count_cols else None
-        try:
-            count_cols.remove(first_count_col)
-        except (ValueError,TypeError):
-            pass
+        # the other count columns are each checked against the first one
+        count_cols = frozenset(count_cols[1:])
 
         
             
@@ -682,46 +1088,40 @@ def generate_effort_summaries(joined_dfs, summaries_config):
             #cover percentages
             if func in ["sum", "max", "min"] and "cover\n" in col.lower():
 
-                #explicit check mark for valid range
                 qa_check_col = "QA Check\nrange check\n0-100% +1"
-                summary_df[qa_check_col] = ""
-                summary_df.loc[(summary_df[col] >= 0) & (summary_df[col] <= 101.0), qa_check_col] = "\u2713"
-                summary_df.loc[summary_df[col] < 0, qa_check_col] = f"{col_name}_{func} negative"
-                summary_df.loc[summary_df[col] > 101.0, qa_check_col] = f"{col_name}_{func} > 101%"
-                summary_df.loc[summary_df[col].isnull(), qa_check_col] = (
-                    f"{col_name}_{func} missing"
-                )
+                x = summary_df[col].to_numpy(dtype=float, na_value=np.nan)
+                # np.select takes the first matching condition so they are listed from highest to lowest priority
+                conditions = [np.isnan(x), x > 101.0, x < 0, (x >= 0) & (x <= 101.0)]
+                labels = [f"{col_name}_{func} missing", f"{col_name}_{func} > 101%", f"{col_name}_{func} negative", "\u2713"]
                 if func == "max":
-                    summary_df.loc[summary_df[col] == 0, qa_check_col] = f"{col_name}_{func} is 0"
+                    conditions.insert(0, x == 0)
+                    labels.insert(0, f"{col_name}_{func} is 0")
+                summary_df[qa_check_col] = qa_labels(conditions, labels)
                     
             #Date Range > 7 days
             min_col_name = f"{col_name}\nmin"
             if func == "max" and "Date" in col and min_col_name in summary_df.columns:
                 if pd.api.types.is_datetime64_any_dtype(summary_df[col]):
                     qa_check_col = "QA Check\ndate range\n> 7d"
-                    # Initialize the column to prevent ValueError if the first assignment is to an empty slice
-                    summary_df[qa_check_col] = ""
                     duration = summary_df[col] - summary_df[min_col_name]
-                    mask = duration > pd.Timedelta(days=7)
-                    summary_df.loc[mask, qa_check_col] = "long survey (" + duration[mask].dt.days.astype(str) + " days)"
+                    long_survey = (duration > MAX_SURVEY_DURATION).to_numpy()
+                    # only the long surveys need their day count formatted, missing dates match neither condition and stay ""
+                    labels = np.full(len(summary_df), "", dtype=object)
+                    labels[long_survey] = [f"long survey ({days} days)" for days in duration.dt.days.to_numpy()[long_survey].astype(np.int64)]
                     #explicit check mark for valid range
-                    summary_df.loc[duration <= pd.Timedelta(days=7), qa_check_col] = "\u2713"
+                    labels[(duration <= MAX_SURVEY_DURATION).to_numpy()] = "\u2713"
+                    # the long survey labels differ per row so the categories come from the values themselves
+                    summary_df[qa_check_col] = pd.Categorical(labels)
                  
             nunique_col_name = f"{col_name}\nnunique"
             if func == "count" and nunique_col_name in summary_df.columns:
                 if pd.api.types.is_numeric_dtype(summary_df[col]):
                     qa_check_col = f"QA Check\n{nunique_col_name} = {col}"
-                    # Initialize the column to prevent ValueError if the first assignment is to an empty slice
-                    summary_df[qa_check_col] = ""
-                    summary_df.loc[summary_df[col] != summary_df[nunique_col_name], qa_check_col] = "mismatched"
-                    #explicit check mark for valid range
-                    summary_df.loc[summary_df[col].notna() & (summary_df[col] == summary_df[nunique_col_name]), qa_check_col] = "\u2713"
+                    summary_df[qa_check_col] = qa_match_labels(summary_df[col], summary_df[nunique_col_name], "mismatched")
                     
             if func == "count" and col in count_cols:
                 qa_check_col = f"QA Check\n{col} = {first_count_col}"
-                summary_df[qa_check_col] = ""
-                summary_df.loc[summary_df[col] != summary_df[first_count_col], qa_check_col] = "mismatched"
-                summary_df.loc[summary_df[col].notna() & (summary_df[col] == summary_df[first_count_col]), qa_check_col] = "\u2713"
+                summary_df[qa_check_col] = qa_match_labels(summary_df[col], summary_df[first_count_col], "mismatched")
 
             
             #find any columns in summary_funcs.items() that are also in group_by_cols and check that the count of those columns is equal to the count of QuadratPlotID for the same group_by. This is to check for any potential data quality issues where there may be multiple records for some sampling units that have soil moisture data, which could indicate a data quality issue or it could be a valid property of the data. By checking for values greater than the count of QuadratPlotID, we can identify any potential outliers or data quality issues.
@@ -731,51 +1131,59 @@ def generate_effort_summaries(joined_dfs, summaries_config):
             if func == "count" and "SoilMoisture" in col and plot_id_count_col in summary_df.columns:
                 #should be equal to the count of QuadratPlotID for the same group_by (which should be the number of records that have soil moisture data), if there are more records than that, it may indicate that there are multiple soil moisture records for some sampling units, which could be a data quality issue or it could be a valid property of the data. By checking for values greater than the count of QuadratPlotID, we can identify any potential outliers or data quality issues.
                 qa_check_col = "QA Check\nSoilMoisture count\nvs QuadratPlotID count"
-                summary_df[qa_check_col] = ""
-                summary_df.loc[summary_df[col] != summary_df[plot_id_count_col], qa_check_col] = f"{col_name} missing for QuadratPlotID"
-                #explicit check mark for valid range
-                summary_df.loc[summary_df[col].notna() & (summary_df[col] == summary_df[plot_id_count_col]), qa_check_col] = "\u2713"
+                summary_df[qa_check_col] = qa_match_labels(summary_df[col], summary_df[plot_id_count_col], f"{col_name} missing for QuadratPlotID")
                 
             # check if needed if "Count" in col and "Count" in summary_funcs and "sum" in summary_funcs["Count"]:
             #     qa_outliers("sum", col, summary_df, col_map)
-            if func == "nunique" and "ScientificName" in col:
-                qa_outliers(func, col, summary_df)
-            
-            #if "count" appears in col_map.items() more than once assume all counts should be the same.  To add QA check, skip over the 1st count column, then for the 2nd, 3rd and subsequent count columns we compare the count to the 1st column and flag any missmatch
-            
-            
-                
-            if func == "count":
-                qa_outliers(func, col, summary_df)
-            if func == "sum":
-                qa_outliers(func, col, summary_df)
-            if func == "mean":
+
+            # IQR outlier check, run at most once per column even when more than one of these rules applies to it.
+            # (Date count columns used to be checked twice, both runs wrote the same column)
+            if (
+                (func == "nunique" and "ScientificName" in col)
+                or func in ("count", "sum", "mean")
+                or ("Date\n" in col and f"{col_name}\nnunique" in summary_df.columns)
+            ):
                 qa_outliers(func, col, summary_df)
-            if "Date\n" in col:
-                if func == "count":
-                    # col = col_map["count"]
-                    # mode = summary_df[func_map].mode()
-                    # if not mode.empty:
-                    #     mode_val = mode.iloc[0]
-                    #     qa_check_col = "QA Check\nmode check"
-                    #     summary_df[qa_check_col] = ""
-                    #     summary_df.loc[summary_df[func_map] > mode_val, qa_check_col] = (
-                    #         f"{col} count > mode ({mode_val})"
-                    #     )
-                    #     summary_df.loc[summary_df[func_map] < mode_val, qa_check_col] = (
-                    #         f"{col} count < mode ({mode_val})"
-                    #     )
-                    #     #explicit check mark for valid range
-                    #     summary_df.loc[summary_df[func_map] == mode_val, qa_check_col] = "\u2713"
-                    qa_outliers(func, col, summary_df)
-
-                if f"{col_name}\nnunique" in summary_df.columns:
-                    qa_outliers(func, col, summary_df)
 
         summary_tables[summary_name] = (table_name, summary_df)
 
     return summary_tables
 
+def qa_labels(conditions, labels, default=""):
+    """
+    Builds the labels for a QA check column from row conditions, the first matching condition giving each row its label.
+    The column is categorical so it holds a small integer code per row and each label string only once.
+
+    Args:
+        conditions (list): Boolean arrays, one per label, in priority order.
+        labels (list): Label for the rows matching each condition.
+        default (str): Label for rows matching no condition.
+
+    Returns:
+        pd.Categorical: The label of each row.
+    """
+    codes = np.select(conditions, np.arange(len(labels), dtype=np.int8), default=len(labels))
+    return pd.Categorical.from_codes(codes, categories=labels + [default])
+
+
+def qa_match_labels(values, expected, mismatch_label):
+    """
+    Builds the labels for a QA check that compares two summary columns row by row.
+
+    Args:
+        values (pd.Series): The column being checked.
+        expected (pd.Series): The column it should be equal to.
+        mismatch_label (str): Label for rows where the values differ (including missing values).
+
+    Returns:
+        pd.Categorical: "\u2713" where the values match, otherwise mismatch_label.
+    """
+    #explicit check mark for valid range.
+    # na_value=False as comparisons on nullable (dtype_backend) columns leave <NA> where a value is missing, which counts as a mismatch
+    matched = (values.notna() & (values == expected)).to_numpy(dtype=bool, na_value=False)
+    return qa_labels([matched], ["\u2713"], default=mismatch_label)
+
+
 def qa_outliers(func, col, summary_df):
     """
     Performs outlier detection using the Interquartile Range (IQR) method and flags outliers in the summary DataFrame.
@@ -787,8 +1195,18 @@ def qa_outliers(func, col, summary_df):
         col_map (dict): Mapping from function names to the actual column names in summary_df.
     """
     
-    q1 = summary_df[col].quantile(0.25)
-    q3 = summary_df[col].quantile(0.75)
+    values = summary_df[col]
+    # cheap min/max pass first (pandas rather than numpy as date columns are checked too)
+    min_value, max_value = values.min(), values.max()
+    if pd.isna(min_value):
+        # all missing, no quartiles to check against
+        return
+    if min_value == max_value:
+        # constant column, both quartiles are that value so skip the sort
+        q1 = q3 = min_value
+    else:
+        # both quartiles from one quantile call (one sort of the column)
+        q1, q3 = values.quantile([0.25, 0.75])
     iqr = q3 - q1
 
     if pd.notna(iqr):
@@ -798,22 +1216,96 @@ def qa_outliers(func, col, summary_df):
         qa_check_col = f"QA Check\n{col}\noutliers IQR\n[{lower_bound:.1f}, {upper_bound:.1f}]"
   
 
-        summary_df[qa_check_col] = ""
-        summary_df.loc[summary_df[col] > upper_bound, qa_check_col] = (
-                            f"high {col}"
-                        )
-        summary_df.loc[summary_df[col] < lower_bound, qa_check_col] = (
-                            f"low {col}"
-                        )
         if func == "count":
-            summary_df.loc[summary_df[col].isna() | (summary_df[col] == 0), qa_check_col] = "no data"
+            no_data = values.isna() | (values == 0)
             #explicit check mark for valid range only
-            summary_df.loc[summary_df[col].notna() & (summary_df[col] > 0) & (summary_df[col] >= lower_bound) & (summary_df[col] <= upper_bound), qa_check_col] = "\u2713"
+            in_range = values.notna() & (values > 0) & (values >= lower_bound) & (values <= upper_bound)
         else:
-            summary_df.loc[summary_df[col].isna(), qa_check_col] = "no data"
+            no_data = values.isna()
             #explicit check mark for valid range only
-            summary_df.loc[summary_df[col].notna() & (summary_df[col] >= lower_bound) & (summary_df[col] <= upper_bound), qa_check_col] = "\u2713"
-        
+            in_range = values.notna() & (values >= lower_bound) & (values <= upper_bound)
+
+        # one assignment, the first matching condition wins so "no data" takes precedence over high/low.
+        # na_value=False as comparisons on nullable (dtype_backend) columns leave <NA> where the value is missing
+        conditions = [in_range, no_data, values < lower_bound, values > upper_bound]
+        summary_df[qa_check_col] = qa_labels(
+            [condition.to_numpy(dtype=bool, na_value=False) for condition in conditions],
+            ["\u2713", "no data", f"low {col}", f"high {col}"],
+        )
+
+
+def _process_group(group_name, dfs, config, output_path, data_date, plot_workers=1):
+    """
+    Joins, summarises, plots and reports a single group. Kept at module level so it can run in a worker process.
+
+    Args:
+        group_name (str): Name of the group being reported.
+        dfs (dict): The group's tables from load_data.
+        config (BaseQAReportConfig): The report configuration.
+        output_path (Path): Directory to save the plots and reports in.
+        data_date (str): Date of the data extract shown in the reports.
+        plot_workers (int): Passed to create_plots as max_workers.
+
+    Returns:
+        dict: The group's data summaries from generate_effort_summaries.
+    """
+    # Join tables based on the defined joins_required
+    joined_dfs = join_tables_generic(dfs, config.joins_required, verbose=config.verbose)
+
+    # Generate data summaries based on the defined DATA_SUMMARIES
+    data_summaries = generate_effort_summaries(joined_dfs, config.data_summary_definitions)
+    plot_collection = create_plots(
+        joined_dfs, data_summaries, config.plot_definitions, output_path, max_workers=plot_workers,
+        filename_prefix=f"{make_safe(group_name)}_", missing_key_cols=missing_key_columns(config.data_summary_definitions),
+    )
+
+
+    if config.create_markdown_report:
+        md_report = MarkdownQAReport(output_path, group_name, config.report_title)
+        md_report.create_report(
+            data_summaries, plot_collection,
+            config.input_file,
+            config.start_date,
+            config.end_date,
+            config.plot_definitions,
+            config.data_summary_definitions,
+            config.group_id[group_name],
+            data_date,
+            data_url = f"{config.data_url}?group_id={config.group_id[group_name]}",
+            left_justify_columns = getattr(config, "left_justify_columns", None),
+        )
+
+    pdf_report = PDFQAReport(output_path, group_name, config.report_title)
+    pdf_report.create_report(
+        data_summaries, plot_collection, config.input_file,
+        config.start_date,
+        config.end_date,
+        config.plot_definitions,
+        config.data_summary_definitions,
+        config.group_id[group_name],
+        data_date,
+        data_url = f"{config.data_url}?group_id={config.group_id[group_name]}",
+        left_justify_columns = getattr(config, "left_justify_columns", None),
+    )
+
+    if not config.create_markdown_report:
+        # only this group's plots, other groups may still be building their reports
+        delete_existing_plots(output_path, plot_collection)
+    return data_summaries
+
+
+def save_group_summaries(data_summaries, output_path):
+    """
+    Saves a group's data summary tables as CSV files in the output directory.
+
+    Args:
+        data_summaries (dict): The group's data summaries from generate_effort_summaries.
+        output_path (Path): Directory to save the CSV files in.
+    """
+    for summary_name, (_, summary_df) in data_summaries.items():
+        output_csv = output_path / f"b_{make_safe(summary_name)}.csv"
+        summary_df.to_csv(output_csv, index=False)
+        print(f"Data summary table '{summary_name}' saved to {output_csv}")
 
 
 def main():
@@ -847,59 +1339,35 @@ def main():
         config.testing_group_name,
         config.filter_by_date,
         config.start_date,
-        config.end_date
+        config.end_date,
+        engine=config.excel_engine,
+        sheet_dtypes=config.sheet_dtypes,
+        dtype_backend=config.dtype_backend,
+        cache_dir=config.workbooks_path / ".qa_cache" if config.sheet_cache else None,
     )
     if not workbook_data:
         print("No data loaded. Please check the input file and configuration.")
         return
     
 
-    for group_name in workbook_data:
-        dfs = workbook_data[group_name]
-        # Join tables based on the defined joins_required
-        joined_dfs = join_tables_generic(dfs, config.joins_required)
-
-        # Generate data summaries based on the defined DATA_SUMMARIES
-        data_summaries = generate_effort_summaries(joined_dfs, config.data_summary_definitions)
-        plot_collection = create_plots(joined_dfs, data_summaries, config.plot_definitions, output_path)
-
-
-        if config.create_markdown_report:
-            # Save data summary tables
-            for summary_name, (_, summary_df) in data_summaries.items():
-                output_csv = output_path / f"b_{make_safe(summary_name)}.csv"
-                summary_df.to_csv(output_csv, index=False)
-                print(f"Data summary table '{summary_name}' saved to {output_csv}")
-            
-            md_report = MarkdownQAReport(output_path, group_name, config.report_title)
-            md_report.create_report(
-                data_summaries, plot_collection,
-                config.input_file,
-                config.start_date,
-                config.end_date,
-                config.plot_definitions,
-                config.data_summary_definitions,
-                config.group_id[group_name],
-                data_date,
-                data_url = f"{config.data_url}?group_id={config.group_id[group_name]}",
-                left_justify_columns = getattr(config, "left_justify_columns", None),
-            )
-
-        pdf_report = PDFQAReport(output_path, group_name, config.report_title)
-        pdf_report.create_report(
-            data_summaries, plot_collection, config.input_file,
-            config.start_date,
-            config.end_date,
-            config.plot_definitions,
-            config.data_summary_definitions,
-            config.group_id[group_name],
-            data_date,
-            data_url = f"{config.data_url}?group_id={config.group_id[group_name]}",
-            left_justify_columns = getattr(config, "left_justify_columns", None),
-        )
-        
-        if not config.create_markdown_report:
-            delete_existing_plots(output_path)
+    group_workers = min(len(workbook_data), config.group_workers or os.cpu_count())
+    if group_workers == 1:
+        for group_name, dfs in workbook_data.items():
+            data_summaries = _process_group(group_name, dfs, config, output_path, data_date, plot_workers=config.plot_workers)
+            if config.create_markdown_report:
+                save_group_summaries(data_summaries, output_path)
+    else:
+        # groups are independent so report them in parallel, each rendering its own plots in-process.
+        # The summary CSVs share one name across groups so they are written here in group order, as the serial loop does
+        with ProcessPoolExecutor(max_workers=group_workers) as executor:
+            futures = [
+                executor.submit(_process_group, group_name, dfs, config, output_path, data_date, plot_workers=1)
+                for group_name, dfs in workbook_data.items()
+            ]
+            for future in futures:
+                data_summaries = future.result()
+                if config.create_markdown_report:
+                    save_group_summaries(data_summaries, output_path)
 
 if __name__ == "__main__":
     main()
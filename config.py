@@ -29,6 +29,22 @@ class BaseQAReportConfig:
     
     
     filter_by_date: bool = True
+    # Excel reader engine passed to pandas. None uses the pandas default (openpyxl), "calamine" is much faster on large workbooks if python-calamine is installed
+    excel_engine: str = None
+    # optional column dtypes per sheet applied when the sheet is read e.g. {"FishSurveyEffort": {"SampleDate": "datetime64[ns]", "SampleType": "category"}}
+    # datetime columns are passed to parse_dates so they don't need converting after the read
+    sheet_dtypes: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    # pandas dtype backend used when reading sheets. None keeps the default numpy dtypes, "pyarrow" stores text columns as Arrow strings (needs pyarrow installed)
+    dtype_backend: str = None
+    # keep the parsed sheets in workbooks_path/.qa_cache so repeat runs on the same workbook skip the Excel parse.
+    # The cache files are pickles, which can run code when loaded, so only turn this on if nobody untrusted can write to the workbooks folder
+    sheet_cache: bool = False
+    # number of worker processes used to render plots. 1 renders them in the main process, None uses every CPU
+    plot_workers: int = 1
+    # number of groups reported in parallel worker processes. 1 reports them one after another, None uses every CPU (capped at the number of groups)
+    group_workers: int = 1
+    # print progress details such as which version (joined or workbook) of each table is used
+    verbose: bool = True
     create_markdown_report: bool = False
     workbooks_path: Path = Path("workbooks")
     output_path: Path = Path("outputs")
@@ -75,9 +91,10 @@ def get_config(**kwargs) -> BaseQAReportConfig:
         "fishlarvae": FishLarvaeQAReportConfig,
     }
 
-    for prefix, config_class in config_map.items():
-        if filename.split("_")[0].lower() == prefix.lower():
-            return config_class(**kwargs)
+    # the keys are lower case so the first token of the filename indexes the map directly
+    config_class = config_map.get(filename.split("_", 1)[0])
+    if config_class is not None:
+        return config_class(**kwargs)
 
 
     raise ValueError(
@@ -16,6 +16,75 @@ from reportlab.lib.enums import TA_CENTER
 from reportlab.pdfbase import pdfmetrics
 from html import escape
 import datetime
+import functools
+
+
+# text widths of table headers and cells, which repeat across rows and tables (ids, dates, QA labels)
+_string_width = functools.lru_cache(maxsize=8192)(pdfmetrics.stringWidth)
+
+
+def _build_styles():
+    """
+    Builds the paragraph styles used in the report.
+    Defines custom styles for headers, titles, and normal text to ensure consistent formatting.
+
+    Returns:
+        tuple: (StyleSheet1, normal ParagraphStyle, bold ParagraphStyle)
+    """
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='Centered', alignment=TA_CENTER))
+    styles['Heading1'].spaceBefore = 20
+    styles["Title"].spaceBefore = 10
+    styles["Title"].spaceAfter = 10
+
+    normal_style = ParagraphStyle(
+        'Normal',
+        parent=styles['Normal'],
+        fontSize=9,
+    )
+    bold_style = ParagraphStyle(
+        'Bold',
+        parent=styles['Normal'],
+        fontName="Helvetica-Bold",
+        fontSize=9,
+    )
+    return styles, normal_style, bold_style
+
+
+# styles are never changed while building, so every report shares one set rather than rebuilding it per group
+_STYLES, _NORMAL_STYLE, _BOLD_STYLE = _build_styles()
+# summary table header and cell styles, and the constant table styles, shared the same way
+_TABLE_HEADER_STYLE = ParagraphStyle('HeaderPara', parent=_STYLES['Normal'], fontName='Helvetica-Bold', fontSize=8, alignment=1)
+_TABLE_CELL_CENTRE_STYLE = ParagraphStyle('CellPara', parent=_STYLES['Normal'], fontSize=8, alignment=1)
+_TABLE_CELL_LEFT_STYLE = ParagraphStyle('CellPara', parent=_STYLES['Normal'], fontSize=8, alignment=0)
+_GLOSSARY_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+])
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.whitesmoke]),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.lightslategrey),
+    ("TOPPADDING", (0, 0), (-1, -1), 1),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+    ("LEFTPADDING", (0, 0), (-1, -1), 2),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 2),
+])
+
+# (term, explanation) rows of the glossary table. Paragraphs are still created per report as reportlab keeps layout state on them
+GLOSSARY_TERMS = [
+    ('nunique:', 'Count of unique values for a column (e.g. number of unique species, number of unique sampling units, etc.)'),
+    ('Outliers IQR:', 'Uses the Inter-Quartile Range (distance between 25th and 75th percentiles) to identify outliers. Values more than 1.5 IQR below the 25th percentile or above the 75th percentile are flagged for review.'),
+    ('range check 0-100% +1:', 'Checks that percent cover values are within a valid range (0-100%) allowing an extra 1% margin for rounding errors. Values greater than 101% are flagged for review, as well as any missing values.'),
+    ('missmatched:', 'Count of records in one column that does not match another column (e.g. count of samples vs count of unique SamplingUnitsIDs.  Flagged for review but can be a valid outcome of the sampling design.'),
+    ('records', 'records is a count of the number of data records in the column. This will include counts of 0 (zero) therefore it is possible to have a record count that exceeds the sum.'),
+    ('NaN:', 'Not a Number (i.e. missing value).  Flagged for review.'),
+    ('numbers:', 'are printed to 2 decimal places for display; summaries use the full precision.'),
+]
 
 
 class PDFQAReport:
@@ -48,7 +117,7 @@ class PDFQAReport:
             bottomMargin=20
         )
         
-        self.styles = getSampleStyleSheet()
+        self.styles = _STYLES
         self._setup_styles()
         self.elements = []
 
@@ -58,28 +127,12 @@ class PDFQAReport:
 
     def _setup_styles(self):
         """
-        Configures the paragraph styles used in the report.
-        Defines custom styles for headers, titles, and normal text to ensure consistent formatting.
+        Binds the shared module level paragraph styles used in the report.
         """
-        self.styles.add(ParagraphStyle(name='Centered', alignment=TA_CENTER))
         self.h1 = self.styles['Heading1']
-        self.h1.spaceBefore = 20
-        
         self.title_style = self.styles["Title"]
-        self.title_style.spaceBefore = 10
-        self.title_style.spaceAfter = 10
-        
-        self.normal_style = ParagraphStyle(
-            'Normal',
-            parent=self.styles['Normal'],
-            fontSize=9,
-        )
-        self.bold_style = ParagraphStyle(
-            'Bold',
-            parent=self.styles['Normal'],
-            fontName="Helvetica-Bold",
-            fontSize=9,
-        )
+        self.normal_style = _NORMAL_STYLE
+        self.bold_style = _BOLD_STYLE
 
     def create_report(self, data_summaries, plot_collection, input_filename, start_dt, end_dt, plot_definitions, data_summary_definitions, group_id, data_date, data_url=None, left_justify_columns=None):
         """
@@ -99,7 +152,7 @@ class PDFQAReport:
             left_justify_columns (set, optional): Set of column names to left-justify in tables.
         """
         # Header and Title
-        self.elements.append(Image("resources//CEWH crest and FLOW-MER-inline_CMYK.png", width=13.0*cm, height=2.5*cm, kind="proportional", hAlign="CENTER"))
+        self.elements.append(Image("resources/CEWH crest and FLOW-MER-inline_CMYK.png", width=13.0*cm, height=2.5*cm, kind="proportional", hAlign="CENTER"))
         self.elements.append(Spacer(1, 9))
         
         title = Paragraph(f"{self.group_name} {self.report_title_str}", self.title_style)
@@ -172,23 +225,9 @@ class PDFQAReport:
         Adds a glossary table explaining common terms used in the report (e.g., nunique, IQR).
         """
         self.elements.append(Paragraph("Glossary", self.styles["Heading2"]))
-        glossary_data = [
-            [Paragraph('nunique:', self.bold_style), Paragraph('Count of unique values for a column (e.g. number of unique species, number of unique sampling units, etc.)', self.normal_style)],
-            [Paragraph('Outliers IQR:', self.bold_style), Paragraph('Uses the Inter-Quartile Range (distance between 25th and 75th percentiles) to identify outliers. Values more than 1.5 IQR below the 25th percentile or above the 75th percentile are flagged for review.', self.normal_style)],
-            [Paragraph('range check 0-100% +1:', self.bold_style), Paragraph('Checks that percent cover values are within a valid range (0-100%) allowing an extra 1% margin for rounding errors. Values greater than 101% are flagged for review, as well as any missing values.', self.normal_style)],
-            [Paragraph('missmatched:', self.bold_style), Paragraph('Count of records in one column that does not match another column (e.g. count of samples vs count of unique SamplingUnitsIDs.  Flagged for review but can be a valid outcome of the sampling design.', self.normal_style)],
-            [Paragraph('records', self.bold_style), Paragraph('records is a count of the number of data records in the column. This will include counts of 0 (zero) therefore it is possible to have a record count that exceeds the sum.', self.normal_style)],
-            [Paragraph('NaN:', self.bold_style), Paragraph('Not a Number (i.e. missing value).  Flagged for review.', self.normal_style)],
-            [Paragraph('numbers:', self.bold_style), Paragraph('are printed to 2 decimal places for display; summaries use the full precision.', self.normal_style)],
-        ]
+        glossary_data = [[Paragraph(term, self.bold_style), Paragraph(text, self.normal_style)] for term, text in GLOSSARY_TERMS]
         glossary_table = Table(glossary_data, colWidths=[3*cm, None])
-        glossary_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-            ('TOPPADDING', (0, 0), (-1, -1), 2),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ]))
+        glossary_table.setStyle(_GLOSSARY_TABLE_STYLE)
         self.elements.append(glossary_table)
 
     def _add_summary_tables(self, data_summaries, data_summary_definitions, left_justify_columns):
@@ -212,22 +251,20 @@ class PDFQAReport:
             self.elements.append(Paragraph(f"Source Table: {table_name}", self.styles["Italic"]))
             self.elements.append(Spacer(1, 6))
             
+            # round numbers for display on a copy so the summary itself keeps full precision for anything else that uses it
             numeric_cols = summary_df.select_dtypes(include=["number"]).columns
-            summary_df[numeric_cols] = summary_df[numeric_cols].round(2)
-            
-            df_str = summary_df.astype(str)
+            df_str = summary_df.round({col: 2 for col in numeric_cols}).astype(str)
             available_width = self.doc.width
             
             col_alignments = []
             raw_col_widths = []
             for col in df_str.columns: 
                 header_lines = str(col).split('\n')
-                max_width = max([pdfmetrics.stringWidth(line, 'Helvetica-Bold', 8) for line in header_lines]) if header_lines else 0
-                for val in df_str[col].head(50):
-                    lines = str(val).split('\n')
-                    for line in lines:
-                        w = pdfmetrics.stringWidth(line, 'Helvetica', 8)
-                        if w > max_width: max_width = w
+                max_width = max([_string_width(line, 'Helvetica-Bold', 8) for line in header_lines]) if header_lines else 0
+                # each distinct line is only measured once
+                for line in {line for val in df_str[col].head(50) for line in str(val).split('\n')}:
+                    w = _string_width(line, 'Helvetica', 8)
+                    if w > max_width: max_width = w
                 raw_col_widths.append(max_width+8)
                 
                 if left_justify_columns and any(sub.lower() in col.lower() for sub in left_justify_columns):
@@ -243,36 +280,21 @@ class PDFQAReport:
                 scale_factor = available_width / total_capped_width
                 col_widths = [w * scale_factor for w in capped_widths]
             
-            header_para_style = ParagraphStyle('HeaderPara', parent=self.styles['Normal'], fontName='Helvetica-Bold', fontSize=8, alignment=1)
-            cell_para_centre_style = ParagraphStyle('CellPara', parent=self.styles['Normal'], fontSize=8, alignment=1)
-            cell_para_left_style = ParagraphStyle('CellPara', parent=self.styles['Normal'], fontSize=8, alignment=0)
-            
             data = []
-            headers = [Paragraph(escape(str(col)).replace("\n", "<br/>"), header_para_style) for col in summary_df.columns]
+            headers = [Paragraph(escape(str(col)).replace("\n", "<br/>"), _TABLE_HEADER_STYLE) for col in summary_df.columns]
             data.append(headers)
             
-            for _, row in df_str.iterrows():
-                row_data = []
-                for i, cell in enumerate(row):
-                    style = cell_para_left_style if col_alignments[i] == 0 else cell_para_centre_style
+            cell_styles = [_TABLE_CELL_LEFT_STYLE if alignment == 0 else _TABLE_CELL_CENTRE_STYLE for alignment in col_alignments]
+            # walk the cell values as plain lists rather than building a Series per row with iterrows
+            for row in df_str.to_numpy().tolist():
+                data.append([
                     # if cell type is a string
-                    if isinstance(cell, str):
-                        row_data.append(Paragraph(escape(cell).replace("\n", "<br/>"), style))
-                    else:
-                        row_data.append(Paragraph(str(cell), style))
-                data.append(row_data)
+                    Paragraph(escape(cell).replace("\n", "<br/>") if isinstance(cell, str) else str(cell), style)
+                    for cell, style in zip(row, cell_styles)
+                ])
 
             t = Table(data, colWidths=col_widths)
-            t.setStyle(TableStyle([
-                ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.whitesmoke]),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.lightslategrey),
-                ("TOPPADDING", (0, 0), (-1, -1), 1),  
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-                ("LEFTPADDING", (0, 0), (-1, -1), 2),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 2),
-            ]))
+            t.setStyle(_SUMMARY_TABLE_STYLE)
             self.elements.append(t)
             self.elements.append(Spacer(1, 9))
 
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from QA_report import _close_cached_figures, _render_one
+
+PIE_CONFIG = {"category": "Species", "value": "Count"}
+
+
+def render_pie(tmp_path, name, df):
+    return plt.imread(tmp_path / _render_one("pie", name, ("SP5",), "SP5", df, PIE_CONFIG, tmp_path, 6))
+
+
+def test_empty_pie_after_pie_matches_fresh_figure(tmp_path):
+    full = pd.DataFrame({"Species": ["Murray cod", "Carp gudgeon"], "Count": [3, 1]})
+    empty = pd.DataFrame({"Species": ["Murray cod", "Carp gudgeon"], "Count": [0, 0]})
+    try:
+        render_pie(tmp_path, "full", full)
+        reused = render_pie(tmp_path, "reused", empty)
+        _close_cached_figures()
+        fresh = render_pie(tmp_path, "fresh", empty)
+    finally:
+        _close_cached_figures()
+    assert reused.shape == fresh.shape
+    assert (reused == fresh).all()
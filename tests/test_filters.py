@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from QA_report import build_filter_mask, filter_df
+
+DF = pd.DataFrame({
+    "SampleType": ["DriftNet", "LightTrap", "Electro", None],
+    "Count": [5, 0, 12, 3],
+})
+
+
+def test_conditions_are_combined():
+    mask = build_filter_mask({"SampleType": {"in": ["DriftNet", "Electro"]}, "Count": {">": 4, "<": 10}}, DF)
+    assert mask.tolist() == [True, False, False, False]
+
+
+def test_null_conditions():
+    assert build_filter_mask({"SampleType": "is null"}, DF).tolist() == [False, False, False, True]
+    assert build_filter_mask({"SampleType": "IS NOT NULL"}, DF).tolist() == [True, True, True, False]
+
+
+def test_not_in_and_not_equal():
+    assert build_filter_mask({"SampleType": {"not in": ["DriftNet"]}}, DF).tolist() == [False, True, True, True]
+    assert build_filter_mask({"Count": {"!=": 0}}, DF).tolist() == [True, False, True, True]
+
+
+def test_missing_values_never_match_on_nullable_columns():
+    df = pd.DataFrame({"Count": pd.array([5, pd.NA, 1], dtype="Int64")})
+    assert build_filter_mask({"Count": {">": 2}}, df).tolist() == [True, False, False]
+
+
+def test_skipped_conditions_leave_the_frame_unfiltered():
+    # unknown column, unsupported operator and a membership operator without a list are all skipped
+    mask = build_filter_mask({"Missing": "is null", "Count": {">=": 1}, "SampleType": {"in": "DriftNet"}}, DF)
+    assert mask is None
+    assert filter_df({"Missing": "is null"}, DF) is DF
+
+
+def test_filter_df_selects_the_matching_rows():
+    filtered = filter_df({"Count": {">": 4}}, DF)
+    assert filtered.index.tolist() == [0, 2]
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from QA_report import join_tables_generic
+
+
+def test_joins_follow_dependencies_not_config_order():
+    dfs = {
+        "Counts": pd.DataFrame({"SurveyID": [1, 2], "Count": [5, 7]}),
+        "Surveys": pd.DataFrame({"SurveyID": [1, 2], "SiteID": ["A", "B"]}),
+        "Sites": pd.DataFrame({"SiteID": ["A", "B"], "SiteName": ["North", "South"]}),
+    }
+    joins = {
+        "Counts": {"right": "Surveys", "on": ["SurveyID"], "how": "left"},
+        "Surveys": {"right": "Sites", "on": ["SiteID"], "how": "left"},
+    }
+    joined = join_tables_generic(dfs, joins, verbose=False)
+    # Counts picks up SiteName because Surveys is joined to Sites first
+    assert joined["Counts"]["SiteName"].tolist() == ["North", "South"]
+
+
+def test_circular_joins_fall_back_to_config_order():
+    dfs = {"Surveys": pd.DataFrame({"SurveyID": [1, 2], "SiteID": ["A", "B"]})}
+    joins = {"Surveys": {"right": "Surveys", "on": ["SurveyID"], "how": "left"}}
+    joined = join_tables_generic(dfs, joins, verbose=False)
+    assert list(joined["Surveys"].columns) == ["SurveyID", "SiteID_x", "SiteID_y"]
+
+
+def test_right_columns_with_a_single_on_column():
+    dfs = {
+        "Counts": pd.DataFrame({"SurveyID": [1, 2], "Count": [5, 7]}),
+        "Surveys": pd.DataFrame({"SurveyID": [1, 2], "SiteID": ["A", "B"], "Comment": ["", "late"]}),
+    }
+    joins = {"Counts": {"right": "Surveys", "on": "SurveyID", "how": "left", "right_columns": ["SiteID"]}}
+    joined = join_tables_generic(dfs, joins, verbose=False)
+    assert list(joined["Counts"].columns) == ["SurveyID", "Count", "SiteID"]
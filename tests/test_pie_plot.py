@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from QA_report import create_single_pie_plot
+
+
+def test_all_zero_group_draws_no_positive_data():
+    # every value is zero, so there are no slices to label
+    df = pd.DataFrame({"Species": ["Murray cod", "Carp gudgeon"], "Count": [0, 0]})
+    fig, ax = plt.subplots()
+    try:
+        create_single_pie_plot(ax, df, "Species", "Count", "Site A")
+        assert ax.get_title() == "Site A\n(No data to plot)"
+        assert [text.get_text() for text in ax.texts] == ["No positive data"]
+    finally:
+        plt.close(fig)
@@ -0,0 +1,48 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from QA_report import create_plots, missing_key_columns
+from configs.veg_config import VegQAReportConfig
+from configs.waterbird_config import WaterbirdQAReportConfig
+
+
+def test_veg_plots_drop_rows_missing_a_group_key(tmp_path):
+    config = VegQAReportConfig()
+    plot_name = "PLOTS: most common 5 taxa x SamplingUnitID x SampleDate"
+    species = pd.DataFrame({
+        "SamplePointName": ["SP1", "SP1", "SP2"],
+        "QuadratPlotID": ["Q1", "Q1", np.nan],
+        "TransectID": [np.nan, np.nan, np.nan],
+        "SampleDate": pd.to_datetime(["2025-03-06"] * 3),
+        "ScientificName": ["Juncus", "Typha", "Juncus"],
+        "PercentCover": [10.0, 5.0, 20.0],
+    })
+    plots = create_plots(
+        {"VegSpeciesAbundance": species}, {}, {plot_name: config.plot_definitions[plot_name]}, tmp_path,
+        max_workers=1, missing_key_cols=missing_key_columns(config.data_summary_definitions),
+    )
+    assert plots[plot_name] == [
+        "PLOTS_most_common_5_taxa_x_SamplingUnitID_x_SampleDate_SP1_Q1_2025-03-06.png"
+    ]
+
+
+def test_waterbird_plots_keep_missing_survey_method(tmp_path):
+    config = WaterbirdQAReportConfig()
+    plot_name = "Summary of your 'count_accuracy' for each site and sampling method (pooling across any multiple surveys)"
+    counts = pd.DataFrame({
+        "SamplePointName": ["SP1", "SP1", "SP2"],
+        "SurveyMethod": ["ground", np.nan, np.nan],
+        "CountAccuracy": ["exact", "estimate", "exact"],
+    })
+    plots = create_plots(
+        {"WaterbirdCounts": counts}, {}, {plot_name: config.plot_definitions[plot_name]}, tmp_path,
+        max_workers=1, missing_key_cols=missing_key_columns(config.data_summary_definitions),
+    )
+    assert [name.rsplit("_", 2)[-2:] for name in plots[plot_name]] == [
+        ["SP1", "ground.png"], ["SP1", "Missing.png"], ["SP2", "Missing.png"]
+    ]
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from QA_report import qa_labels, qa_match_labels
+
+
+def test_match_labels_on_nullable_columns():
+    values = pd.Series([3, pd.NA, 5, 2], dtype="Int64")
+    expected = pd.Series([3, 4, pd.NA, 1], dtype="Int64")
+    labels = qa_match_labels(values, expected, "count differs")
+    assert list(labels) == ["✓", "count differs", "count differs", "count differs"]
+
+
+def test_match_labels_on_numpy_columns():
+    values = pd.Series([3.0, np.nan, 5.0])
+    expected = pd.Series([3.0, np.nan, 4.0])
+    labels = qa_match_labels(values, expected, "count differs")
+    assert list(labels) == ["✓", "count differs", "count differs"]
+
+
+def test_first_matching_condition_wins():
+    conditions = [np.array([True, False, False]), np.array([True, True, False])]
+    labels = qa_labels(conditions, ["✓", "no data"], default="high Count")
+    assert list(labels) == ["✓", "no data", "high Count"]
+    assert list(labels.categories) == ["✓", "no data", "high Count"]
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from QA_report import create_single_scatter_plot
+
+
+def test_one_scatter_per_category_in_order_of_appearance():
+    df = pd.DataFrame({
+        "x": [1, 2, 3, 4, 5],
+        "y": [1.0, 2.0, 3.0, 2.5, 4.0],
+        "Method": ["ground", "aerial", "ground", np.nan, "aerial"],
+    })
+    fig, ax = plt.subplots()
+    try:
+        create_single_scatter_plot(ax, df, "x", "y", "Method", "Site A", color_map={"aerial": "red", "ground": "green"})
+        # points with no category are not drawn
+        assert [len(collection.get_offsets()) for collection in ax.collections] == [2, 2]
+        assert [collection.get_label() for collection in ax.collections] == ["ground", "aerial"]
+        assert [text.get_text() for text in ax.get_legend().get_texts()] == ["ground", "aerial"]
+    finally:
+        plt.close(fig)
@@ -0,0 +1,50 @@
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import QA_report
+from QA_report import prune_sheet_cache, read_workbook_sheets
+
+
+def write_workbook(path):
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"SiteID": ["A", "B"], "Count": [1, 2]}).to_excel(writer, sheet_name="Counts", index=False)
+
+
+def test_cached_sheets_match_the_workbook(tmp_path):
+    workbook = tmp_path / "book.xlsx"
+    write_workbook(workbook)
+    cache_dir = tmp_path / "cache"
+    first = read_workbook_sheets(workbook, ["Counts", "Absent"], cache_dir=cache_dir)
+    assert list(first) == ["Counts"]
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+    cached = read_workbook_sheets(workbook, ["Counts", "Absent"], cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(cached["Counts"], first["Counts"])
+
+
+def test_cache_hit_keeps_the_file_from_being_pruned(tmp_path):
+    workbook = tmp_path / "book.xlsx"
+    write_workbook(workbook)
+    cache_dir = tmp_path / "cache"
+    read_workbook_sheets(workbook, ["Counts"], cache_dir=cache_dir)
+    (cache_file,) = cache_dir.glob("*.pkl")
+    # make the cache file look older than the cutoff, then use it
+    old = cache_file.stat().st_mtime - QA_report.SHEET_CACHE_MAX_AGE.total_seconds() - 60
+    os.utime(cache_file, (old, old))
+    read_workbook_sheets(workbook, ["Counts"], cache_dir=cache_dir)
+    prune_sheet_cache(cache_dir)
+    assert cache_file.exists()
+
+
+def test_prune_keeps_the_newest_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(QA_report, "SHEET_CACHE_MAX_FILES", 2)
+    for i in range(4):
+        cache_file = tmp_path / f"book_{i}.pkl"
+        cache_file.write_bytes(b"")
+        os.utime(cache_file, (1_800_000_000 + i, 1_800_000_000 + i))
+    prune_sheet_cache(tmp_path)
+    assert sorted(f.name for f in tmp_path.glob("*.pkl")) == ["book_2.pkl", "book_3.pkl"]